@@ -1,5 +1,6 @@
 import base64
-from typing import Union, Optional
+import json
+from typing import Union, Optional, Any
 from collections.abc import Sequence, Iterable, AsyncIterator, Iterator
 
 import httpcore
@@ -32,6 +33,13 @@ class IteratorStream(AsyncIteratorByteStream, IteratorByteStream):
         IteratorByteStream.__init__(self, stream=Stream())
 
 
+def _encode_json(content: Any) -> bytes:
+    """Encode JSON content the same way httpx does (compact, UTF-8)."""
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
 def _to_httpx_url(url: httpcore.URL, headers: list[tuple[bytes, bytes]]) -> httpx.URL:
     for name, value in headers:
         if b"Proxy-Authorization" == name:
@@ -1,14 +1,15 @@
-import copy
+import heapq
 import inspect
+from collections import deque
 from typing import Union, Optional, Callable, Any, NoReturn
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Iterable
 
 import httpx
 
 from pytest_httpx import _httpx_internals
 from pytest_httpx._options import _HTTPXMockOptions
 from pytest_httpx._pretty_print import RequestDescription
-from pytest_httpx._request_matcher import _RequestMatcher
+from pytest_httpx._request_matcher import _RequestMatcher, _ReceivedRequest
 
 
 class HTTPXMock:
@@ -19,9 +20,29 @@ class HTTPXMock:
     def __init__(self, options: _HTTPXMockOptions) -> None:
         """Private and subject to breaking changes without notice."""
         self._options = options
-        self._requests: list[
+        self._requests: deque[
             tuple[Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport], httpx.Request]
-        ] = []
+        ] = deque()
+        # Same requests, grouped by method and URL (without query) for faster retrieval
+        self._requests_by_key: dict[
+            tuple[str, str],
+            list[
+                tuple[
+                    Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport],
+                    httpx.Request,
+                ]
+            ],
+        ] = {}
+        # Same requests, grouped by method for faster retrieval when URL is not provided
+        self._requests_by_method: dict[
+            str,
+            list[
+                tuple[
+                    Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport],
+                    httpx.Request,
+                ]
+            ],
+        ] = {}
         self._callbacks: list[
             tuple[
                 _RequestMatcher,
@@ -33,6 +54,36 @@ class HTTPXMock:
                 ],
             ]
         ] = []
+        # Same callbacks (with their registration order), grouped by URL (without query) for faster retrieval
+        self._callbacks_by_url: dict[
+            str,
+            list[
+                tuple[
+                    int,
+                    _RequestMatcher,
+                    Callable[
+                        [httpx.Request],
+                        Union[
+                            Optional[httpx.Response],
+                            Awaitable[Optional[httpx.Response]],
+                        ],
+                    ],
+                ]
+            ],
+        ] = {}
+        # Callbacks that cannot be grouped by URL (matching any URL or an URL pattern)
+        self._callbacks_without_url: list[
+            tuple[
+                int,
+                _RequestMatcher,
+                Callable[
+                    [httpx.Request],
+                    Union[
+                        Optional[httpx.Response], Awaitable[Optional[httpx.Response]]
+                    ],
+                ],
+            ]
+        ] = []
         self._requests_not_matched: list[httpx.Request] = []
 
     def add_response(
@@ -72,7 +123,17 @@ class HTTPXMock:
         :param is_reusable: True will allow re-using this response even if it already matched, False prevent re-using it. Must be a boolean. Default to the can_send_already_matched_responses option value (itself defaulting to False).
         """
 
-        json = copy.deepcopy(json) if json is not None else None
+        # Encode headers once, httpx.Response will copy them without encoding them again
+        headers = httpx.Headers(headers)
+        if json is not None and all(
+            body is None for body in (content, text, html, stream)
+        ):
+            # Encode once, this also prevents further modifications of json from being sent
+            content = _httpx_internals._encode_json(json)
+            # Same default headers, in the same order, as the ones httpx would have set
+            headers.setdefault("Content-Length", str(len(content)))
+            headers.setdefault("Content-Type", "application/json")
+            json = None
 
         def response_callback(request: httpx.Request) -> httpx.Response:
             return httpx.Response(
@@ -88,6 +149,15 @@ class HTTPXMock:
 
         self.add_callback(response_callback, **matchers)
 
+    def add_responses(self, responses: Iterable[dict[str, Any]]) -> None:
+        """
+        Mock the responses that will be sent if requests match, in the provided order.
+
+        :param responses: Parameters of every response to mock. Each item must be a dictionary accepting the same keys as the add_response parameters.
+        """
+        for response in responses:
+            self.add_response(**response)
+
     def add_callback(
         self,
         callback: Callable[
@@ -115,7 +185,15 @@ class HTTPXMock:
         :param is_optional: True will mark this callback as optional, False will expect a request matching it. Must be a boolean. Default to the opposite of assert_all_responses_were_requested option value (itself defaulting to True, meaning this parameter default to False).
         :param is_reusable: True will allow re-using this callback even if it already matched, False prevent re-using it. Must be a boolean. Default to the can_send_already_matched_responses option value (itself defaulting to False).
         """
-        self._callbacks.append((_RequestMatcher(self._options, **matchers), callback))
+        matcher = _RequestMatcher(self._options, **matchers)
+        registered = (len(self._callbacks), matcher, callback)
+        self._callbacks.append((matcher, callback))
+        if isinstance(matcher.url, httpx.URL):
+            self._callbacks_by_url.setdefault(
+                _url_key(matcher.url.copy_with(query=None)), []
+            ).append(registered)
+        else:
+            self._callbacks_without_url.append(registered)
 
     def add_exception(self, exception: Exception, **matchers: Any) -> None:
         """
@@ -151,9 +229,10 @@ class HTTPXMock:
     ) -> httpx.Response:
         # Store the content in request for future matching
         request.read()
-        self._requests.append((real_transport, request))
+        received = _ReceivedRequest(real_transport, request)
+        self._store_request(received)
 
-        callback = self._get_callback(real_transport, request)
+        callback = self._get_callback(received)
         if callback:
             response = callback(request)
 
@@ -169,9 +248,10 @@ class HTTPXMock:
     ) -> httpx.Response:
         # Store the content in request for future matching
         await request.aread()
-        self._requests.append((real_transport, request))
+        received = _ReceivedRequest(real_transport, request)
+        self._store_request(received)
 
-        callback = self._get_callback(real_transport, request)
+        callback = self._get_callback(received)
         if callback:
             response = callback(request)
 
@@ -182,6 +262,15 @@ class HTTPXMock:
 
         self._request_not_matched(real_transport, request)
 
+    def _store_request(self, received: _ReceivedRequest) -> None:
+        # Only store the request as it can be modified after matching (by callbacks for example)
+        stored = (received.real_transport, received.request)
+        self._requests.append(stored)
+        self._requests_by_key.setdefault(
+            _request_key(received.request.method, received.url_without_query), []
+        ).append(stored)
+        self._requests_by_method.setdefault(received.request.method, []).append(stored)
+
     def _request_not_matched(
         self,
         real_transport: Union[httpx.AsyncHTTPTransport, httpx.HTTPTransport],
@@ -222,20 +311,22 @@ class HTTPXMock:
 
         return message
 
-    def _get_callback(
-        self,
-        real_transport: Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport],
-        request: httpx.Request,
-    ) -> Optional[
+    def _get_callback(self, received: _ReceivedRequest) -> Optional[
         Callable[
             [httpx.Request],
             Union[Optional[httpx.Response], Awaitable[Optional[httpx.Response]]],
         ]
     ]:
+        # Only callbacks registered on the same URL (without query) or on any URL can match
+        # Merge them back in registration order as it determines which callback is used
+        candidates = heapq.merge(
+            self._callbacks_by_url.get(_url_key(received.url_without_query), []),
+            self._callbacks_without_url,
+        )
         callbacks = [
             (matcher, callback)
-            for matcher, callback in self._callbacks
-            if matcher.match(real_transport, request)
+            for _, matcher, callback in candidates
+            if matcher.match(received)
         ]
 
         # No callback match this request
@@ -274,10 +365,19 @@ class HTTPXMock:
         :param match_extensions: Extensions identifying the requests to retrieve. Must be a dictionary.
         """
         matcher = _RequestMatcher(self._options, **matchers)
+        if matcher.method and isinstance(matcher.url, httpx.URL):
+            # Only requests sharing the same method and URL (without query) can match
+            requests = self._requests_by_key.get(
+                _request_key(matcher.method, matcher.url.copy_with(query=None)), []
+            )
+        elif matcher.method:
+            requests = self._requests_by_method.get(matcher.method, [])
+        else:
+            requests = self._requests
         return [
             request
-            for real_transport, request in self._requests
-            if matcher.match(real_transport, request)
+            for real_transport, request in requests
+            if matcher.match(_ReceivedRequest(real_transport, request))
         ]
 
     def get_request(self, **matchers: Any) -> Optional[httpx.Request]:
@@ -305,7 +405,11 @@ class HTTPXMock:
 
     def reset(self) -> None:
         self._requests.clear()
+        self._requests_by_key.clear()
+        self._requests_by_method.clear()
         self._callbacks.clear()
+        self._callbacks_by_url.clear()
+        self._callbacks_without_url.clear()
         self._requests_not_matched.clear()
 
     def _assert_options(self) -> None:
@@ -338,6 +442,15 @@ class HTTPXMock:
             )
 
 
+def _url_key(url_without_query: httpx.URL) -> str:
+    # Query parameters order does not matter when matching, so they cannot be part of the key
+    return str(url_without_query)
+
+
+def _request_key(method: str, url_without_query: httpx.URL) -> tuple[str, str]:
+    return method, _url_key(url_without_query)
+
+
 def _unread(response: httpx.Response) -> httpx.Response:
     # Allow to read the response on client side
     response.is_stream_consumed = False
@@ -26,7 +26,91 @@ def _url_match(
     return (received_params == params) and (url == received_url)
 
 
+# Distinguish a request body that was not decoded yet from one that cannot be decoded
+_NOT_DECODED = object()
+_INVALID_JSON = object()
+
+
+class _ReceivedRequest:
+    """Request values used for matching, computed at most once whatever the number of matchers."""
+
+    __slots__ = (
+        "real_transport",
+        "request",
+        "_url_without_query",
+        "_params",
+        "_headers",
+        "_json",
+    )
+
+    def __init__(
+        self,
+        real_transport: Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport],
+        request: httpx.Request,
+    ):
+        self.real_transport = real_transport
+        self.request = request
+        self._url_without_query: Optional[httpx.URL] = None
+        self._params: Optional[dict[str, str]] = None
+        self._headers: Optional[dict[bytes, bytes]] = None
+        self._json: Any = _NOT_DECODED
+
+    @property
+    def url_without_query(self) -> httpx.URL:
+        if self._url_without_query is None:
+            self._url_without_query = self.request.url.copy_with(query=None)
+        return self._url_without_query
+
+    @property
+    def params(self) -> dict[str, str]:
+        if self._params is None:
+            self._params = dict(self.request.url.params)
+        return self._params
+
+    @property
+    def headers(self) -> dict[bytes, bytes]:
+        if self._headers is None:
+            self._headers = {}
+            # Can be cleaned based on the outcome of https://github.com/encode/httpx/discussions/2841
+            for raw_name, raw_value in self.request.headers.raw:
+                if raw_name in self._headers:
+                    self._headers[raw_name] += b", " + raw_value
+                else:
+                    self._headers[raw_name] = raw_value
+        return self._headers
+
+    @property
+    def json(self) -> Any:
+        if self._json is _NOT_DECODED:
+            try:
+                # httpx._content.encode_json hard codes utf-8 encoding.
+                self._json = json.loads(self.request.content.decode("utf-8"))
+            except json.decoder.JSONDecodeError:
+                self._json = _INVALID_JSON
+        return self._json
+
+
 class _RequestMatcher:
+    __slots__ = (
+        "_options",
+        "nb_calls",
+        "url",
+        "method",
+        "headers",
+        "content",
+        "json",
+        "data",
+        "files",
+        "proxy_url",
+        "extensions",
+        "is_optional",
+        "is_reusable",
+        "_checks",
+        "_url_without_query",
+        "_params",
+        "_encoded_headers",
+    )
+
     def __init__(
         self,
         options: _HTTPXMockOptions,
@@ -45,8 +129,14 @@ class _RequestMatcher:
         self._options = options
         self.nb_calls = 0
         self.url = httpx.URL(url) if url and isinstance(url, str) else url
+        if isinstance(self.url, httpx.URL):
+            # Compare query parameters apart as order of parameters should not matter
+            self._url_without_query = self.url.copy_with(query=None)
+            self._params = dict(self.url.params)
         self.method = method.upper() if method else method
         self.headers = match_headers
+        # Expected headers encoded once per request headers encoding
+        self._encoded_headers: dict[str, tuple[tuple[bytes, bytes], ...]] = {}
         self.content = match_content
         self.json = match_json
         self.data = match_data
@@ -57,8 +147,33 @@ class _RequestMatcher:
             else proxy_url
         )
         self.extensions = match_extensions
-        self.is_optional = not options.assert_all_responses_were_requested if is_optional is None else is_optional
-        self.is_reusable = options.can_send_already_matched_responses if is_reusable is None else is_reusable
+        self.is_optional = (
+            not options.assert_all_responses_were_requested
+            if is_optional is None
+            else is_optional
+        )
+        self.is_reusable = (
+            options.can_send_already_matched_responses
+            if is_reusable is None
+            else is_reusable
+        )
+        # Only check the provided criteria (none for the most common case of a default response)
+        # Body is checked last as it might require to build the expected multipart content
+        self._checks = tuple(
+            check
+            for provided, check in (
+                (self.url, self._url_match),
+                (self.method, self._method_match),
+                (self.headers, self._headers_match),
+                (self.proxy_url, self._proxy_match),
+                (self.extensions, self._extensions_match),
+                (
+                    self.content is not None or self.json is not None or self.files,
+                    self._content_match,
+                ),
+            )
+            if provided
+        )
         if self._is_matching_body_more_than_one_way():
             raise ValueError(
                 "Only one way of matching against the body can be provided. "
@@ -88,96 +203,69 @@ class _RequestMatcher:
         ]
         return sum(matching_ways) > 1
 
-    def match(
-        self,
-        real_transport: Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport],
-        request: httpx.Request,
-    ) -> bool:
-        return (
-            self._url_match(request)
-            and self._method_match(request)
-            and self._headers_match(request)
-            and self._content_match(request)
-            and self._proxy_match(real_transport)
-            and self._extensions_match(request)
-        )
-
-    def _url_match(self, request: httpx.Request) -> bool:
-        if not self.url:
-            return True
+    def match(self, received: _ReceivedRequest) -> bool:
+        return all(check(received) for check in self._checks)
 
-        return _url_match(self.url, request.url)
+    def _url_match(self, received: _ReceivedRequest) -> bool:
+        if isinstance(self.url, re.Pattern):
+            return _url_match(self.url, received.request.url)
 
-    def _method_match(self, request: httpx.Request) -> bool:
-        if not self.method:
-            return True
-
-        return request.method == self.method
+        return (
+            received.params == self._params
+            and received.url_without_query == self._url_without_query
+        )
 
-    def _headers_match(self, request: httpx.Request) -> bool:
-        if not self.headers:
-            return True
+    def _method_match(self, received: _ReceivedRequest) -> bool:
+        return received.request.method == self.method
 
-        encoding = request.headers.encoding
-        request_headers = {}
-        # Can be cleaned based on the outcome of https://github.com/encode/httpx/discussions/2841
-        for raw_name, raw_value in request.headers.raw:
-            if raw_name in request_headers:
-                request_headers[raw_name] += b", " + raw_value
-            else:
-                request_headers[raw_name] = raw_value
+    def _headers_match(self, received: _ReceivedRequest) -> bool:
+        encoding = received.request.headers.encoding
+        if (encoded_headers := self._encoded_headers.get(encoding)) is None:
+            encoded_headers = self._encoded_headers[encoding] = tuple(
+                (header_name.encode(encoding), header_value.encode(encoding))
+                for header_name, header_value in self.headers.items()
+            )
 
+        request_headers = received.headers
         return all(
-            request_headers.get(header_name.encode(encoding))
-            == header_value.encode(encoding)
-            for header_name, header_value in self.headers.items()
+            request_headers.get(header_name) == header_value
+            for header_name, header_value in encoded_headers
         )
 
-    def _content_match(self, request: httpx.Request) -> bool:
+    def _content_match(self, received: _ReceivedRequest) -> bool:
+        request = received.request
         if self.content is not None:
             return request.content == self.content
 
         if self.json is not None:
-            try:
-                # httpx._content.encode_json hard codes utf-8 encoding.
-                return json.loads(request.content.decode("utf-8")) == self.json
-            except json.decoder.JSONDecodeError:
+            return received.json is not _INVALID_JSON and received.json == self.json
+
+        if not (boundary_matched := re.match(b"^--([0-9a-f]*)\r\n", request.content)):
+            return False
+        # Ensure we re-use the same boundary for comparison
+        boundary = boundary_matched.group(1)
+        # Prevent internal httpx changes from impacting users not matching on files
+        from httpx._multipart import MultipartStream
+
+        multipart_content = MultipartStream(self.data or {}, self.files, boundary)
+        # Compare chunk by chunk to stop at the first difference without building the full expected body
+        content = request.content
+        position = 0
+        for chunk in multipart_content:
+            if not content.startswith(chunk, position):
                 return False
+            position += len(chunk)
+        return position == len(content)
 
-        if self.files:
-            if not (
-                boundary_matched := re.match(b"^--([0-9a-f]*)\r\n", request.content)
-            ):
-                return False
-            # Ensure we re-use the same boundary for comparison
-            boundary = boundary_matched.group(1)
-            # Prevent internal httpx changes from impacting users not matching on files
-            from httpx._multipart import MultipartStream
-
-            multipart_content = b"".join(
-                MultipartStream(self.data or {}, self.files, boundary)
-            )
-            return request.content == multipart_content
-
-        return True
-
-    def _proxy_match(
-        self, real_transport: Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport]
-    ) -> bool:
-        if not self.proxy_url:
-            return True
-
-        if real_proxy_url := _proxy_url(real_transport):
+    def _proxy_match(self, received: _ReceivedRequest) -> bool:
+        if real_proxy_url := _proxy_url(received.real_transport):
             return _url_match(self.proxy_url, real_proxy_url)
 
         return False
 
-    def _extensions_match(self, request: httpx.Request) -> bool:
-        if not self.extensions:
-            return True
-
+    def _extensions_match(self, received: _ReceivedRequest) -> bool:
         return all(
-            request.extensions.get(extension_name) == extension_value
+            received.request.extensions.get(extension_name) == extension_value
             for extension_name, extension_value in self.extensions.items()
         )
 
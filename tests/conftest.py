@@ -1,2 +1,27 @@
+import os
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+import pytest_asyncio
+
 # see https://docs.pytest.org/en/documentation-restructure/how-to/writing_plugins.html#testing-plugins
 pytest_plugins = ["pytester"]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    # Mocked transports are patched at class level, a single client can be shared
+    # Requests never reach the network, so there is no certificate to load
+    async with httpx.AsyncClient(verify=False) as client:
+        yield client
+
+
+@pytest.fixture
+def fixed_boundary(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Ensure generated multipart boundary will be fbe495efe4cd41b941ca13e254d6b018
+    monkeypatch.setattr(
+        os,
+        "urandom",
+        lambda length: b"\xfb\xe4\x95\xef\xe4\xcdA\xb9A\xca\x13\xe2T\xd6\xb0\x18",
+    )
@@ -1,6 +1,6 @@
-import os
 import re
 from collections.abc import Iterable
+from typing import Any, Optional
 from unittest.mock import ANY
 
 import httpx
@@ -10,10 +10,59 @@ from pytest import Testdir
 import pytest_httpx
 from pytest_httpx import HTTPXMock
 
+# User-Agent header sent by httpx, formatted once for all tests
+USER_AGENT = f"python-httpx/{httpx.__version__}"
+# Matching headers sent by httpx by default, never modified by httpx_mock
+USER_AGENT_HEADERS = {"User-Agent": USER_AGENT}
+
+# Timeout extension of requests sent with httpx.Timeout(5, write=10)
+WRITE_TIMEOUT_EXTENSIONS = {
+    "timeout": {"connect": 5, "read": 5, "write": 10, "pool": 5}
+}
+
+# URL pattern matching any host containing test, compiled once for all tests
+# Patterns are matched from the start of the URL, other URLs fail as soon as the host is read
+TEST_URL_PATTERN = re.compile(r"https://[^/]*test")
+
+# URL used by most tests, parsed once for all tests
+TEST_URL = httpx.URL("https://test_url")
+
+# URLs with a single query parameter, built once for all tests
+URLS_WITH_PARAM = {
+    f"param{index}": TEST_URL.copy_add_param(f"param{index}", "test")
+    for index in range(1, 7)
+}
+
+# One response per HTTP method, as add_response parameters
+RESPONSES_PER_METHOD = [
+    {"method": "GET", "content": b"test content 1", "status_code": 200},
+    {"method": "POST", "content": b"test content 2", "status_code": 201},
+    {"method": "PUT", "content": b"test content 3", "status_code": 202},
+    {"method": "DELETE", "content": b"test content 4", "status_code": 303},
+    {"method": "PATCH", "content": b"test content 5", "status_code": 404},
+    {"method": "HEAD", "content": b"test content 6", "status_code": 500},
+]
+
+
+def assert_raw_stream(response: httpx.Response, expected_parts: list[bytes]) -> None:
+    assert list(response.iter_raw()) == expected_parts
+    # Assert that stream still behaves the proper way (can only be consumed once per request)
+    with pytest.raises(httpx.StreamConsumed):
+        list(response.iter_raw())
+
+
+def assert_read_stream(response: httpx.Response, expected_content: bytes) -> None:
+    # Content sent as a single part does not need to be iterated over
+    response.read()
+    assert response.content == expected_content
+    # Assert that stream still behaves the proper way (can only be consumed once per request)
+    with pytest.raises(httpx.StreamConsumed):
+        list(response.iter_raw())
+
 
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
 def test_without_response(httpx_mock: HTTPXMock) -> None:
-    with pytest.raises(Exception) as exception_info:
+    with pytest.raises(httpx.TimeoutException) as exception_info:
         with httpx.Client() as client:
             client.get("https://test_url")
     assert (
@@ -27,9 +76,9 @@ def test_default_response(httpx_mock: HTTPXMock) -> None:
 
     with httpx.Client() as client:
         response = client.get("https://test_url")
-    assert response.content == b""
+    assert not response.content
     assert response.status_code == 200
-    assert response.headers == httpx.Headers({})
+    assert not response.headers
     assert response.http_version == "HTTP/1.1"
 
 
@@ -38,7 +87,7 @@ def test_url_matching(httpx_mock: HTTPXMock) -> None:
 
     with httpx.Client() as client:
         response = client.get("https://test_url")
-        assert response.content == b""
+        assert not response.content
 
 
 def test_url_matching_reusing_response(httpx_mock: HTTPXMock) -> None:
@@ -46,10 +95,10 @@ def test_url_matching_reusing_response(httpx_mock: HTTPXMock) -> None:
 
     with httpx.Client() as client:
         response = client.get("https://test_url")
-        assert response.content == b""
+        assert not response.content
 
         response = client.post("https://test_url")
-        assert response.content == b""
+        assert not response.content
 
 
 def test_url_query_string_matching(httpx_mock: HTTPXMock) -> None:
@@ -57,11 +106,11 @@ def test_url_query_string_matching(httpx_mock: HTTPXMock) -> None:
 
     with httpx.Client() as client:
         response = client.post("https://test_url?a=1&b=2")
-        assert response.content == b""
+        assert not response.content
 
         # Parameters order should not matter
         response = client.get("https://test_url?b=2&a=1")
-        assert response.content == b""
+        assert not response.content
 
 
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
@@ -98,10 +147,10 @@ def test_method_matching(httpx_mock: HTTPXMock) -> None:
 
     with httpx.Client() as client:
         response = client.get("https://test_url")
-        assert response.content == b""
+        assert not response.content
 
         response = client.get("https://test_url2")
-        assert response.content == b""
+        assert not response.content
 
 
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
@@ -173,18 +222,10 @@ def test_stream_response_streaming(httpx_mock: HTTPXMock) -> None:
     )
 
     with httpx.Client() as client:
-        with client.stream(method="GET", url="https://test_url") as response:
-            assert list(response.iter_raw()) == [b"part 1", b"part 2"]
-            # Assert that stream still behaves the proper way (can only be consumed once per request)
-            with pytest.raises(httpx.StreamConsumed):
-                list(response.iter_raw())
-
         # Assert a response can be streamed more than once
-        with client.stream(method="GET", url="https://test_url") as response:
-            assert list(response.iter_raw()) == [b"part 1", b"part 2"]
-            # Assert that stream still behaves the proper way (can only be consumed once per request)
-            with pytest.raises(httpx.StreamConsumed):
-                list(response.iter_raw())
+        for _ in range(2):
+            with client.stream(method="GET", url="https://test_url") as response:
+                assert_raw_stream(response, [b"part 1", b"part 2"])
 
 
 def test_content_response_streaming(httpx_mock: HTTPXMock) -> None:
@@ -195,18 +236,10 @@ def test_content_response_streaming(httpx_mock: HTTPXMock) -> None:
     )
 
     with httpx.Client() as client:
-        with client.stream(method="GET", url="https://test_url") as response:
-            assert list(response.iter_raw()) == [b"part 1 and 2"]
-            # Assert that stream still behaves the proper way (can only be consumed once per request)
-            with pytest.raises(httpx.StreamConsumed):
-                list(response.iter_raw())
-
         # Assert a response can be streamed more than once
-        with client.stream(method="GET", url="https://test_url") as response:
-            assert list(response.iter_raw()) == [b"part 1 and 2"]
-            # Assert that stream still behaves the proper way (can only be consumed once per request)
-            with pytest.raises(httpx.StreamConsumed):
-                list(response.iter_raw())
+        for _ in range(2):
+            with client.stream(method="GET", url="https://test_url") as response:
+                assert_read_stream(response, b"part 1 and 2")
 
 
 def test_text_response_streaming(httpx_mock: HTTPXMock) -> None:
@@ -217,42 +250,30 @@ def test_text_response_streaming(httpx_mock: HTTPXMock) -> None:
     )
 
     with httpx.Client() as client:
-        with client.stream(method="GET", url="https://test_url") as response:
-            assert list(response.iter_raw()) == [b"part 1 and 2"]
-            # Assert that stream still behaves the proper way (can only be consumed once per request)
-            with pytest.raises(httpx.StreamConsumed):
-                list(response.iter_raw())
-
         # Assert a response can be streamed more than once
-        with client.stream(method="GET", url="https://test_url") as response:
-            assert list(response.iter_raw()) == [b"part 1 and 2"]
-            # Assert that stream still behaves the proper way (can only be consumed once per request)
-            with pytest.raises(httpx.StreamConsumed):
-                list(response.iter_raw())
+        for _ in range(2):
+            with client.stream(method="GET", url="https://test_url") as response:
+                assert_read_stream(response, b"part 1 and 2")
 
 
 def test_default_response_streaming(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(is_reusable=True)
 
     with httpx.Client() as client:
-        with client.stream(method="GET", url="https://test_url") as response:
-            assert list(response.iter_raw()) == []
-            # Assert that stream still behaves the proper way (can only be consumed once per request)
-            with pytest.raises(httpx.StreamConsumed):
-                list(response.iter_raw())
-
         # Assert a response can be streamed more than once
-        with client.stream(method="GET", url="https://test_url") as response:
-            assert list(response.iter_raw()) == []
-            # Assert that stream still behaves the proper way (can only be consumed once per request)
-            with pytest.raises(httpx.StreamConsumed):
-                list(response.iter_raw())
+        for _ in range(2):
+            with client.stream(method="GET", url="https://test_url") as response:
+                assert_raw_stream(response, [])
 
 
 def test_with_many_responses(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(url="https://test_url", content=b"test content 1")
-    httpx_mock.add_response(url="https://test_url", content=b"test content 2")
-    httpx_mock.add_response(url="https://test_url", content=b"test content 2")
+    httpx_mock.add_responses(
+        [
+            {"url": "https://test_url", "content": b"test content 1"},
+            {"url": "https://test_url", "content": b"test content 2"},
+            {"url": "https://test_url", "content": b"test content 2"},
+        ]
+    )
 
     with httpx.Client() as client:
         response = client.get("https://test_url")
@@ -266,9 +287,15 @@ def test_with_many_responses(httpx_mock: HTTPXMock) -> None:
 
 
 def test_with_many_reused_responses(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(url="https://test_url", content=b"test content 1")
-    httpx_mock.add_response(
-        url="https://test_url", content=b"test content 2", is_reusable=True
+    httpx_mock.add_responses(
+        [
+            {"url": "https://test_url", "content": b"test content 1"},
+            {
+                "url": "https://test_url",
+                "content": b"test content 2",
+                "is_reusable": True,
+            },
+        ]
     )
 
     with httpx.Client() as client:
@@ -282,150 +309,74 @@ def test_with_many_reused_responses(httpx_mock: HTTPXMock) -> None:
         assert response.content == b"test content 2"
 
 
-def test_with_many_responses_methods(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        url="https://test_url", method="GET", content=b"test content 1"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="POST", content=b"test content 2"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="PUT", content=b"test content 3"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="DELETE", content=b"test content 4"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="PATCH", content=b"test content 5"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="HEAD", content=b"test content 6"
+@pytest.mark.parametrize("response", RESPONSES_PER_METHOD)
+def test_with_many_responses_methods(
+    httpx_mock: HTTPXMock, response: dict[str, Any]
+) -> None:
+    httpx_mock.add_responses(
+        {"url": "https://test_url", "is_optional": True, **registered_response}
+        for registered_response in RESPONSES_PER_METHOD
     )
 
     with httpx.Client() as client:
-        response = client.post("https://test_url")
-        assert response.content == b"test content 2"
-
-        response = client.get("https://test_url")
-        assert response.content == b"test content 1"
-
-        response = client.put("https://test_url")
-        assert response.content == b"test content 3"
-
-        response = client.head("https://test_url")
-        assert response.content == b"test content 6"
-
-        response = client.patch("https://test_url")
-        assert response.content == b"test content 5"
-
-        response = client.delete("https://test_url")
-        assert response.content == b"test content 4"
+        received = client.request(response["method"], "https://test_url")
+    assert received.content == response["content"]
+    assert received.status_code == response["status_code"]
 
 
-def test_with_many_responses_status_codes(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        url="https://test_url", method="GET", content=b"test content 1", status_code=200
-    )
-    httpx_mock.add_response(
-        url="https://test_url",
-        method="POST",
-        content=b"test content 2",
-        status_code=201,
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="PUT", content=b"test content 3", status_code=202
-    )
-    httpx_mock.add_response(
-        url="https://test_url",
-        method="DELETE",
-        content=b"test content 4",
-        status_code=303,
-    )
-    httpx_mock.add_response(
-        url="https://test_url",
-        method="PATCH",
-        content=b"test content 5",
-        status_code=404,
-    )
-    httpx_mock.add_response(
-        url="https://test_url",
-        method="HEAD",
-        content=b"test content 6",
-        status_code=500,
+def test_with_many_responses_registered_at_once(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_responses(
+        [
+            {"url": "https://test_url", "method": "GET", "content": b"test content 1"},
+            {"url": "https://test_url", "method": "POST", "status_code": 201},
+            {"url": "https://test_url", "content": b"test content 3"},
+            {"url": "https://test_url", "content": b"test content 4"},
+        ]
     )
 
     with httpx.Client() as client:
         response = client.post("https://test_url")
-        assert response.content == b"test content 2"
+        assert not response.content
         assert response.status_code == 201
 
         response = client.get("https://test_url")
         assert response.content == b"test content 1"
         assert response.status_code == 200
 
-        response = client.put("https://test_url")
+        response = client.get("https://test_url")
         assert response.content == b"test content 3"
-        assert response.status_code == 202
-
-        response = client.head("https://test_url")
-        assert response.content == b"test content 6"
-        assert response.status_code == 500
 
-        response = client.patch("https://test_url")
-        assert response.content == b"test content 5"
-        assert response.status_code == 404
-
-        response = client.delete("https://test_url")
+        response = client.put("https://test_url")
         assert response.content == b"test content 4"
-        assert response.status_code == 303
-
-
-def test_with_many_responses_urls_str(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        url="https://test_url?param1=test", method="GET", content=b"test content 1"
-    )
-    httpx_mock.add_response(
-        url="https://test_url?param2=test", method="POST", content=b"test content 2"
-    )
-    httpx_mock.add_response(
-        url="https://test_url?param3=test", method="PUT", content=b"test content 3"
-    )
-    httpx_mock.add_response(
-        url="https://test_url?param4=test", method="DELETE", content=b"test content 4"
-    )
-    httpx_mock.add_response(
-        url="https://test_url?param5=test", method="PATCH", content=b"test content 5"
-    )
-    httpx_mock.add_response(
-        url="https://test_url?param6=test", method="HEAD", content=b"test content 6"
-    )
-
-    with httpx.Client() as client:
-        response = client.post(httpx.URL("https://test_url", params={"param2": "test"}))
-        assert response.content == b"test content 2"
-
-        response = client.get(httpx.URL("https://test_url", params={"param1": "test"}))
-        assert response.content == b"test content 1"
-
-        response = client.put(httpx.URL("https://test_url", params={"param3": "test"}))
-        assert response.content == b"test content 3"
 
-        response = client.head(httpx.URL("https://test_url", params={"param6": "test"}))
-        assert response.content == b"test content 6"
 
-        response = client.patch(
-            httpx.URL("https://test_url", params={"param5": "test"})
+@pytest.mark.parametrize(
+    "registered_url_type, sent_url_type",
+    [(str, httpx.URL), (httpx.URL, str)],
+    ids=["urls_str", "urls_instances"],
+)
+def test_with_many_responses_urls(
+    httpx_mock: HTTPXMock, registered_url_type: type, sent_url_type: type
+) -> None:
+    for index, response in enumerate(RESPONSES_PER_METHOD, start=1):
+        httpx_mock.add_response(
+            url=registered_url_type(URLS_WITH_PARAM[f"param{index}"]),
+            method=response["method"],
+            content=response["content"],
         )
-        assert response.content == b"test content 5"
 
-        response = client.delete(
-            httpx.URL("https://test_url", params={"param4": "test"})
-        )
-        assert response.content == b"test content 4"
+    with httpx.Client() as client:
+        # Send requests in a different order than registration
+        for index in (2, 1, 3, 6, 5, 4):
+            response = RESPONSES_PER_METHOD[index - 1]
+            received = client.request(
+                response["method"], sent_url_type(URLS_WITH_PARAM[f"param{index}"])
+            )
+            assert received.content == response["content"]
 
 
 def test_response_with_pattern_in_url(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(url=re.compile(".*test.*"))
+    httpx_mock.add_response(url=TEST_URL_PATTERN)
     httpx_mock.add_response(url="https://unmatched", content=b"test content")
 
     with httpx.Client() as client:
@@ -433,7 +384,26 @@ def test_response_with_pattern_in_url(httpx_mock: HTTPXMock) -> None:
         assert response.content == b"test content"
 
         response = client.get("https://test_url")
-        assert response.content == b""
+        assert not response.content
+
+
+def test_responses_with_and_without_url_are_sent_in_registration_order(
+    httpx_mock: HTTPXMock,
+) -> None:
+    httpx_mock.add_response(url=TEST_URL_PATTERN, content=b"test content 1")
+    httpx_mock.add_response(url="https://test_url", content=b"test content 2")
+    httpx_mock.add_response(content=b"test content 3")
+    httpx_mock.add_response(url="https://test_url", content=b"test content 4")
+
+    with httpx.Client() as client:
+        for expected_content in (
+            b"test content 1",
+            b"test content 2",
+            b"test content 3",
+            b"test content 4",
+        ):
+            response = client.get("https://test_url")
+            assert response.content == expected_content
 
 
 def test_request_with_pattern_in_url(httpx_mock: HTTPXMock) -> None:
@@ -444,7 +414,7 @@ def test_request_with_pattern_in_url(httpx_mock: HTTPXMock) -> None:
         client.get("https://unmatched")
         client.get("https://test_url", headers={"X-Test": "1"})
 
-    assert httpx_mock.get_request(url=re.compile(".*test.*")).headers["x-test"] == "1"
+    assert httpx_mock.get_request(url=TEST_URL_PATTERN).headers["x-test"] == "1"
 
 
 def test_requests_with_pattern_in_url(httpx_mock: HTTPXMock) -> None:
@@ -457,7 +427,7 @@ def test_requests_with_pattern_in_url(httpx_mock: HTTPXMock) -> None:
         client.get("https://unmatched", headers={"X-Test": "2"})
         client.get("https://test_url")
 
-    requests = httpx_mock.get_requests(url=re.compile(".*test.*"))
+    requests = httpx_mock.get_requests(url=TEST_URL_PATTERN)
     assert len(requests) == 2
     assert requests[0].headers["x-test"] == "1"
     assert "x-test" not in requests[1].headers
@@ -474,7 +444,7 @@ def test_callback_with_pattern_in_url(httpx_mock: HTTPXMock) -> None:
             json={"url": str(request.url)},
         )
 
-    httpx_mock.add_callback(custom_response, url=re.compile(".*test.*"))
+    httpx_mock.add_callback(custom_response, url=TEST_URL_PATTERN)
     httpx_mock.add_callback(custom_response2, url="https://unmatched")
 
     with httpx.Client() as client:
@@ -485,58 +455,6 @@ def test_callback_with_pattern_in_url(httpx_mock: HTTPXMock) -> None:
         assert response.http_version == "HTTP/1.1"
 
 
-def test_with_many_responses_urls_instances(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        url=httpx.URL("https://test_url", params={"param1": "test"}),
-        method="GET",
-        content=b"test content 1",
-    )
-    httpx_mock.add_response(
-        url=httpx.URL("https://test_url", params={"param2": "test"}),
-        method="POST",
-        content=b"test content 2",
-    )
-    httpx_mock.add_response(
-        url=httpx.URL("https://test_url", params={"param3": "test"}),
-        method="PUT",
-        content=b"test content 3",
-    )
-    httpx_mock.add_response(
-        url=httpx.URL("https://test_url", params={"param4": "test"}),
-        method="DELETE",
-        content=b"test content 4",
-    )
-    httpx_mock.add_response(
-        url=httpx.URL("https://test_url", params={"param5": "test"}),
-        method="PATCH",
-        content=b"test content 5",
-    )
-    httpx_mock.add_response(
-        url=httpx.URL("https://test_url", params={"param6": "test"}),
-        method="HEAD",
-        content=b"test content 6",
-    )
-
-    with httpx.Client() as client:
-        response = client.post("https://test_url?param2=test")
-        assert response.content == b"test content 2"
-
-        response = client.get("https://test_url?param1=test")
-        assert response.content == b"test content 1"
-
-        response = client.put("https://test_url?param3=test")
-        assert response.content == b"test content 3"
-
-        response = client.head("https://test_url?param6=test")
-        assert response.content == b"test content 6"
-
-        response = client.patch("https://test_url?param5=test")
-        assert response.content == b"test content 5"
-
-        response = client.delete("https://test_url?param4=test")
-        assert response.content == b"test content 4"
-
-
 def test_with_http_version_2(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
         url="https://test_url", http_version="HTTP/2", content=b"test content 1"
@@ -558,29 +476,15 @@ def test_with_headers(httpx_mock: HTTPXMock) -> None:
     with httpx.Client() as client:
         response = client.get("https://test_url")
         assert response.content == b"test content 1"
-        assert response.headers == httpx.Headers(
-            {"x-test": "Test value", "content-length": "14"}
-        )
+        assert dict(response.headers) == {
+            "x-test": "Test value",
+            "content-length": "14",
+        }
 
 
 def test_requests_retrieval(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        url="https://test_url", method="GET", content=b"test content 1"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="POST", content=b"test content 2"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="PUT", content=b"test content 3"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="DELETE", content=b"test content 4"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="PATCH", content=b"test content 5"
-    )
-    httpx_mock.add_response(
-        url="https://test_url", method="HEAD", content=b"test content 6"
+    httpx_mock.add_responses(
+        {"url": "https://test_url", **response} for response in RESPONSES_PER_METHOD
     )
 
     with httpx.Client() as client:
@@ -591,32 +495,23 @@ def test_requests_retrieval(httpx_mock: HTTPXMock) -> None:
         client.patch("https://test_url", content=b"sent content 5")
         client.delete("https://test_url", headers={"X-Test": "test header 4"})
 
+    assert len(httpx_mock.get_requests(url=TEST_URL)) == 6
     assert (
-        httpx_mock.get_request(url=httpx.URL("https://test_url"), method="PATCH").read()
-        == b"sent content 5"
-    )
-    assert (
-        httpx_mock.get_request(url=httpx.URL("https://test_url"), method="HEAD").read()
-        == b""
+        httpx_mock.get_request(url=TEST_URL, method="PATCH").read() == b"sent content 5"
     )
+    assert httpx_mock.get_request(url=TEST_URL, method="HEAD").read() == b""
     assert (
-        httpx_mock.get_request(url=httpx.URL("https://test_url"), method="PUT").read()
-        == b"sent content 3"
+        httpx_mock.get_request(url=TEST_URL, method="PUT").read() == b"sent content 3"
     )
     assert (
-        httpx_mock.get_request(url=httpx.URL("https://test_url"), method="GET").headers[
-            "x-test"
-        ]
+        httpx_mock.get_request(url=TEST_URL, method="GET").headers["x-test"]
         == "test header 1"
     )
     assert (
-        httpx_mock.get_request(url=httpx.URL("https://test_url"), method="POST").read()
-        == b"sent content 2"
+        httpx_mock.get_request(url=TEST_URL, method="POST").read() == b"sent content 2"
     )
     assert (
-        httpx_mock.get_request(
-            url=httpx.URL("https://test_url"), method="DELETE"
-        ).headers["x-test"]
+        httpx_mock.get_request(url=TEST_URL, method="DELETE").headers["x-test"]
         == "test header 4"
     )
 
@@ -628,12 +523,28 @@ def test_requests_retrieval_on_same_url(httpx_mock: HTTPXMock) -> None:
         client.get("https://test_url", headers={"X-TEST": "test header 1"})
         client.get("https://test_url", headers={"X-TEST": "test header 2"})
 
-    requests = httpx_mock.get_requests(url=httpx.URL("https://test_url"))
+    requests = httpx_mock.get_requests(url=TEST_URL)
     assert len(requests) == 2
     assert requests[0].headers["x-test"] == "test header 1"
     assert requests[1].headers["x-test"] == "test header 2"
 
 
+def test_request_retrieval_after_modification_by_callback(
+    httpx_mock: HTTPXMock,
+) -> None:
+    def add_header(request: httpx.Request) -> httpx.Response:
+        request.headers["X-Added"] = "1"
+        return httpx.Response(status_code=200)
+
+    httpx_mock.add_response(match_headers={"X-Other": "1"}, is_optional=True)
+    httpx_mock.add_callback(add_header)
+
+    with httpx.Client() as client:
+        client.get("https://test_url")
+
+    assert httpx_mock.get_request(match_headers={"X-Added": "1"})
+
+
 def test_request_retrieval_on_same_url(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(is_reusable=True)
 
@@ -641,7 +552,7 @@ def test_request_retrieval_on_same_url(httpx_mock: HTTPXMock) -> None:
         client.get("https://test_url", headers={"X-TEST": "test header 1"})
         client.get("https://test_url2", headers={"X-TEST": "test header 2"})
 
-    request = httpx_mock.get_request(url=httpx.URL("https://test_url"))
+    request = httpx_mock.get_request(url=TEST_URL)
     assert request.headers["x-test"] == "test header 1"
 
 
@@ -678,7 +589,24 @@ def test_requests_retrieval_on_same_url_and_method(httpx_mock: HTTPXMock) -> Non
         client.post("https://test_url", headers={"X-TEST": "test header 3"})
         client.get("https://test_url2", headers={"X-TEST": "test header 4"})
 
-    requests = httpx_mock.get_requests(url=httpx.URL("https://test_url"), method="GET")
+    requests = httpx_mock.get_requests(url=TEST_URL, method="GET")
+    assert len(requests) == 2
+    assert requests[0].headers["x-test"] == "test header 1"
+    assert requests[1].headers["x-test"] == "test header 2"
+
+
+def test_requests_retrieval_on_same_url_with_query_and_method(
+    httpx_mock: HTTPXMock,
+) -> None:
+    httpx_mock.add_response(is_reusable=True)
+
+    with httpx.Client() as client:
+        client.get("https://test_url?a=1&b=2", headers={"X-TEST": "test header 1"})
+        client.get("https://test_url?b=2&a=1", headers={"X-TEST": "test header 2"})
+        client.get("https://test_url?a=2&b=2", headers={"X-TEST": "test header 3"})
+        client.post("https://test_url?a=1&b=2", headers={"X-TEST": "test header 4"})
+
+    requests = httpx_mock.get_requests(url="https://test_url?a=1&b=2", method="GET")
     assert len(requests) == 2
     assert requests[0].headers["x-test"] == "test header 1"
     assert requests[1].headers["x-test"] == "test header 2"
@@ -887,13 +815,11 @@ def test_request_retrieval_with_more_than_one(testdir: Testdir) -> None:
 
 
 def test_headers_matching(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        match_headers={"User-Agent": f"python-httpx/{httpx.__version__}"}
-    )
+    httpx_mock.add_response(match_headers=USER_AGENT_HEADERS)
 
     with httpx.Client() as client:
         response = client.get("https://test_url")
-        assert response.content == b""
+        assert not response.content
 
 
 def test_multi_value_headers_matching(httpx_mock: HTTPXMock) -> None:
@@ -904,7 +830,7 @@ def test_multi_value_headers_matching(httpx_mock: HTTPXMock) -> None:
             "https://test_url",
             headers=[("my-custom-header", "value1"), ("my-custom-header", "value2")],
         )
-        assert response.content == b""
+        assert not response.content
 
 
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
@@ -958,7 +884,7 @@ def test_multi_value_headers_not_matching_multi_value_issued(
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
 def test_headers_matching_respect_case(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
-        match_headers={"user-agent": f"python-httpx/{httpx.__version__}"},
+        match_headers={"user-agent": USER_AGENT},
         is_optional=True,
     )
 
@@ -967,8 +893,8 @@ def test_headers_matching_respect_case(httpx_mock: HTTPXMock) -> None:
             client.get("https://test_url")
         assert (
             str(exception_info.value)
-            == f"""No response can be found for GET request on https://test_url with {{'User-Agent': 'python-httpx/{httpx.__version__}'}} headers amongst:
-- Match any request with {{'user-agent': 'python-httpx/{httpx.__version__}'}} headers"""
+            == f"""No response can be found for GET request on https://test_url with {{'User-Agent': '{USER_AGENT}'}} headers amongst:
+- Match any request with {{'user-agent': '{USER_AGENT}'}} headers"""
         )
 
 
@@ -976,7 +902,7 @@ def test_headers_matching_respect_case(httpx_mock: HTTPXMock) -> None:
 def test_headers_not_matching(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
         match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
+            "User-Agent": USER_AGENT,
             "Host": "test_url2",
             "Host2": "test_url",
         },
@@ -988,8 +914,8 @@ def test_headers_not_matching(httpx_mock: HTTPXMock) -> None:
             client.get("https://test_url")
         assert (
             str(exception_info.value)
-            == f"""No response can be found for GET request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers amongst:
-- Match any request with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2', 'Host2': 'test_url'}} headers"""
+            == f"""No response can be found for GET request on https://test_url with {{'Host': 'test_url', 'User-Agent': '{USER_AGENT}'}} headers amongst:
+- Match any request with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2', 'Host2': 'test_url'}} headers"""
         )
 
 
@@ -1239,6 +1165,20 @@ def test_json_partial_matching(httpx_mock: HTTPXMock) -> None:
         assert response.read() == b""
 
 
+def test_json_matching_amongst_many(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(match_json={"a": 1}, content=b"test content 1")
+    httpx_mock.add_response(match_json={"a": 2}, content=b"test content 2")
+    httpx_mock.add_response(match_json={"a": 3}, content=b"test content 3")
+
+    with httpx.Client() as client:
+        response = client.post("https://test_url", json={"a": 3})
+        assert response.read() == b"test content 3"
+        response = client.post("https://test_url", json={"a": 1})
+        assert response.read() == b"test content 1"
+        response = client.post("https://test_url", json={"a": 2})
+        assert response.read() == b"test content 2"
+
+
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
 def test_json_not_matching(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(match_json={"a": 1, "b": 2}, is_optional=True)
@@ -1287,65 +1227,162 @@ def test_match_json_invalid_json(httpx_mock: HTTPXMock) -> None:
 
 def test_headers_and_content_matching(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
-        match_headers={"User-Agent": f"python-httpx/{httpx.__version__}"},
+        match_headers=USER_AGENT_HEADERS,
         match_content=b"This is the body",
     )
 
     with httpx.Client() as client:
         response = client.post("https://test_url", content=b"This is the body")
-        assert response.content == b""
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_headers_not_matching_and_content_matching(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_headers_matching_and_content_not_matching(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url'}} headers and b'This is the body2' body"""
-        )
+        assert not response.content
 
 
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_headers_and_content_not_matching(httpx_mock: HTTPXMock) -> None:
+@pytest.mark.parametrize(
+    ("url", "method", "host", "content", "expected_matcher"),
+    [
+        pytest.param(
+            None,
+            None,
+            "test_url2",
+            b"This is the body",
+            f"Match any request with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body' body",
+            id="headers_not_matching_and_content_matching",
+        ),
+        pytest.param(
+            None,
+            None,
+            "test_url",
+            b"This is the body2",
+            f"Match any request with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url'}} headers and b'This is the body2' body",
+            id="headers_matching_and_content_not_matching",
+        ),
+        pytest.param(
+            None,
+            None,
+            "test_url2",
+            b"This is the body2",
+            f"Match any request with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body2' body",
+            id="headers_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url",
+            None,
+            "test_url2",
+            b"This is the body",
+            f"Match any request on https://test_url with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body' body",
+            id="headers_not_matching_and_url_and_content_matching",
+        ),
+        pytest.param(
+            "https://test_url2",
+            None,
+            "test_url2",
+            b"This is the body",
+            f"Match any request on https://test_url2 with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body' body",
+            id="url_and_headers_not_matching_and_content_matching",
+        ),
+        pytest.param(
+            "https://test_url",
+            None,
+            "test_url",
+            b"This is the body2",
+            f"Match any request on https://test_url with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url'}} headers and b'This is the body2' body",
+            id="url_and_headers_matching_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url2",
+            None,
+            "test_url",
+            b"This is the body2",
+            f"Match any request on https://test_url2 with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url'}} headers and b'This is the body2' body",
+            id="headers_matching_and_url_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url",
+            None,
+            "test_url2",
+            b"This is the body2",
+            f"Match any request on https://test_url with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body2' body",
+            id="url_matching_and_headers_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url2",
+            None,
+            "test_url2",
+            b"This is the body2",
+            f"Match any request on https://test_url2 with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body2' body",
+            id="url_and_headers_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url",
+            "POST",
+            "test_url2",
+            b"This is the body",
+            f"Match POST request on https://test_url with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body' body",
+            id="headers_not_matching_and_method_and_url_and_content_matching",
+        ),
+        pytest.param(
+            "https://test_url2",
+            "POST",
+            "test_url2",
+            b"This is the body",
+            f"Match POST request on https://test_url2 with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body' body",
+            id="url_and_headers_not_matching_and_method_and_content_matching",
+        ),
+        pytest.param(
+            "https://test_url",
+            "POST",
+            "test_url",
+            b"This is the body2",
+            f"Match POST request on https://test_url with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url'}} headers and b'This is the body2' body",
+            id="method_and_url_and_headers_matching_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url2",
+            "POST",
+            "test_url",
+            b"This is the body2",
+            f"Match POST request on https://test_url2 with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url'}} headers and b'This is the body2' body",
+            id="method_and_headers_matching_and_url_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url",
+            "POST",
+            "test_url2",
+            b"This is the body2",
+            f"Match POST request on https://test_url with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body2' body",
+            id="method_and_url_matching_and_headers_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url2",
+            "POST",
+            "test_url2",
+            b"This is the body2",
+            f"Match POST request on https://test_url2 with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body2' body",
+            id="method_matching_and_url_and_headers_and_content_not_matching",
+        ),
+        pytest.param(
+            "https://test_url2",
+            "PUT",
+            "test_url2",
+            b"This is the body2",
+            f"Match PUT request on https://test_url2 with {{'User-Agent': '{USER_AGENT}', 'Host': 'test_url2'}} headers and b'This is the body2' body",
+            id="method_and_url_and_headers_and_content_not_matching",
+        ),
+    ],
+)
+def test_url_method_headers_and_content_not_matching(
+    httpx_mock: HTTPXMock,
+    url: Optional[str],
+    method: Optional[str],
+    host: str,
+    content: bytes,
+    expected_matcher: str,
+) -> None:
     httpx_mock.add_response(
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body2",
+        url=url,
+        method=method,
+        match_headers={"User-Agent": USER_AGENT, "Host": host},
+        match_content=content,
         is_optional=True,
     )
 
@@ -1354,391 +1391,66 @@ def test_headers_and_content_not_matching(httpx_mock: HTTPXMock) -> None:
             client.post("https://test_url", content=b"This is the body")
         assert (
             str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body2' body"""
+            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': '{USER_AGENT}'}} headers and b'This is the body' body amongst:
+- {expected_matcher}"""
         )
 
 
 def test_url_and_headers_and_content_matching(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
         url="https://test_url",
-        match_headers={"User-Agent": f"python-httpx/{httpx.__version__}"},
+        match_headers=USER_AGENT_HEADERS,
         match_content=b"This is the body",
     )
 
     with httpx.Client() as client:
         response = client.post("https://test_url", content=b"This is the body")
-        assert response.content == b""
+        assert not response.content
 
 
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_headers_not_matching_and_url_and_content_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
+def test_method_and_url_and_headers_and_content_matching(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
         url="https://test_url",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
+        method="POST",
+        match_headers=USER_AGENT_HEADERS,
         match_content=b"This is the body",
-        is_optional=True,
     )
 
     with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request on https://test_url with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_url_and_headers_not_matching_and_content_matching(
-    httpx_mock: HTTPXMock,
+        response = client.post("https://test_url", content=b"This is the body")
+        assert not response.content
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected_cookies"),
+    [
+        pytest.param(
+            [("set-cookie", "key=value"), ("set-cookie", "key2=value2")],
+            {"key": "value", "key2": "value2"},
+            id="str_tuple_list",
+        ),
+        pytest.param(
+            [(b"set-cookie", b"key=value"), (b"set-cookie", b"key2=value2")],
+            {"key": "value", "key2": "value2"},
+            id="bytes_tuple_list",
+        ),
+        pytest.param({b"set-cookie": b"key=value"}, {"key": "value"}, id="bytes_dict"),
+        pytest.param(
+            httpx.Headers({"set-cookie": "key=value"}),
+            {"key": "value"},
+            id="httpx_headers",
+        ),
+    ],
+)
+def test_cookies_from_headers_formats(
+    httpx_mock: HTTPXMock, headers: Any, expected_cookies: dict[str, str]
 ) -> None:
-    httpx_mock.add_response(
-        url="https://test_url2",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body",
-        is_optional=True,
-    )
+    httpx_mock.add_response(headers=headers)
 
     with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request on https://test_url2 with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body' body"""
-        )
+        response = client.get("https://test_url")
 
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_url_and_headers_matching_and_content_not_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request on https://test_url with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url'}} headers and b'This is the body2' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_headers_matching_and_url_and_content_not_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url2",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request on https://test_url2 with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url'}} headers and b'This is the body2' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_url_matching_and_headers_and_content_not_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request on https://test_url with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body2' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_url_and_headers_and_content_not_matching(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        url="https://test_url2",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match any request on https://test_url2 with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body2' body"""
-        )
-
-
-def test_method_and_url_and_headers_and_content_matching(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        url="https://test_url",
-        method="POST",
-        match_headers={"User-Agent": f"python-httpx/{httpx.__version__}"},
-        match_content=b"This is the body",
-    )
-
-    with httpx.Client() as client:
-        response = client.post("https://test_url", content=b"This is the body")
-        assert response.content == b""
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_headers_not_matching_and_method_and_url_and_content_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url",
-        method="POST",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match POST request on https://test_url with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_url_and_headers_not_matching_and_method_and_content_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url2",
-        method="POST",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match POST request on https://test_url2 with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_method_and_url_and_headers_matching_and_content_not_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url",
-        method="POST",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match POST request on https://test_url with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url'}} headers and b'This is the body2' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_method_and_headers_matching_and_url_and_content_not_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url2",
-        method="POST",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match POST request on https://test_url2 with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url'}} headers and b'This is the body2' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_method_and_url_matching_and_headers_and_content_not_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url",
-        method="POST",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match POST request on https://test_url with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body2' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_method_matching_and_url_and_headers_and_content_not_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url2",
-        method="POST",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match POST request on https://test_url2 with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body2' body"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_method_and_url_and_headers_and_content_not_matching(
-    httpx_mock: HTTPXMock,
-) -> None:
-    httpx_mock.add_response(
-        url="https://test_url2",
-        method="PUT",
-        match_headers={
-            "User-Agent": f"python-httpx/{httpx.__version__}",
-            "Host": "test_url2",
-        },
-        match_content=b"This is the body2",
-        is_optional=True,
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.post("https://test_url", content=b"This is the body")
-        assert (
-            str(exception_info.value)
-            == f"""No response can be found for POST request on https://test_url with {{'Host': 'test_url', 'User-Agent': 'python-httpx/{httpx.__version__}'}} headers and b'This is the body' body amongst:
-- Match PUT request on https://test_url2 with {{'User-Agent': 'python-httpx/{httpx.__version__}', 'Host': 'test_url2'}} headers and b'This is the body2' body"""
-        )
-
-
-def test_header_as_str_tuple_list(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        headers=[("set-cookie", "key=value"), ("set-cookie", "key2=value2")]
-    )
-
-    with httpx.Client() as client:
-        response = client.get("https://test_url")
-
-    assert dict(response.cookies) == {"key": "value", "key2": "value2"}
-
-
-def test_header_as_bytes_tuple_list(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        headers=[(b"set-cookie", b"key=value"), (b"set-cookie", b"key2=value2")]
-    )
-
-    with httpx.Client() as client:
-        response = client.get("https://test_url")
-
-    assert dict(response.cookies) == {"key": "value", "key2": "value2"}
-
-
-def test_header_as_bytes_dict(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(headers={b"set-cookie": b"key=value"})
-
-    with httpx.Client() as client:
-        response = client.get("https://test_url")
-
-    assert dict(response.cookies) == {"key": "value"}
-
-
-def test_header_as_httpx_headers(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(headers=httpx.Headers({"set-cookie": "key=value"}))
-
-    with httpx.Client() as client:
-        response = client.get("https://test_url")
-
-    assert dict(response.cookies) == {"key": "value"}
+    assert dict(response.cookies) == expected_cookies
 
 
 def test_elapsed_when_add_response(httpx_mock: HTTPXMock) -> None:
@@ -1764,7 +1476,7 @@ def test_non_ascii_url_response(httpx_mock: HTTPXMock) -> None:
 
     with httpx.Client() as client:
         response = client.get("https://test_url?query_type=数据")
-    assert response.content == b""
+    assert not response.content
 
 
 def test_url_encoded_matching_response(httpx_mock: HTTPXMock) -> None:
@@ -1772,7 +1484,7 @@ def test_url_encoded_matching_response(httpx_mock: HTTPXMock) -> None:
 
     with httpx.Client() as client:
         response = client.get("https://test_url?a=数据")
-    assert response.content == b""
+    assert not response.content
 
 
 def test_reset_is_removing_requests(httpx_mock: HTTPXMock) -> None:
@@ -1801,6 +1513,60 @@ def test_mutating_json(httpx_mock: HTTPXMock) -> None:
         assert response.json() == {"content": "request 2"}
 
 
+def test_mutating_headers(httpx_mock: HTTPXMock) -> None:
+    mutating_headers = {"x-test": "request 1"}
+    httpx_mock.add_response(headers=mutating_headers)
+
+    mutating_headers["x-test"] = "request 2"
+    httpx_mock.add_response(headers=mutating_headers)
+
+    with httpx.Client() as client:
+        response = client.get("https://test_url")
+        assert response.headers["x-test"] == "request 1"
+
+        response = client.get("https://test_url")
+        assert response.headers["x-test"] == "request 2"
+
+
+def test_json_with_custom_content_type(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json={"key": "value"}, headers={"content-type": "application/vnd.api+json"}
+    )
+
+    with httpx.Client() as client:
+        response = client.get("https://test_url")
+    assert response.json() == {"key": "value"}
+    assert response.headers["content-type"] == "application/vnd.api+json"
+
+
+def test_json_with_non_str_keys(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json={1: "value", "é": "non ascii"})
+
+    with httpx.Client() as client:
+        response = client.get("https://test_url")
+    assert response.content == '{"1":"value","é":"non ascii"}'.encode()
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_json_encoded_as_httpx(httpx_mock: HTTPXMock) -> None:
+    json = {"key": ["é", 1.5, 1e16, None]}
+    httpx_mock.add_response(json=json)
+
+    with httpx.Client() as client:
+        response = client.get("https://test_url")
+    expected = httpx.Response(status_code=200, json=json)
+    assert response.content == expected.content
+    assert response.headers.raw == expected.headers.raw
+
+
+def test_json_with_out_of_range_float(httpx_mock: HTTPXMock) -> None:
+    with pytest.raises(ValueError) as exception_info:
+        httpx_mock.add_response(json={"key": float("nan")})
+    assert (
+        str(exception_info.value) == "Out of range float values are not JSON compliant"
+    )
+
+
 def test_custom_transport(httpx_mock: HTTPXMock) -> None:
     class CustomTransport(httpx.HTTPTransport):
         def __init__(self, prefix: str, *args, **kwargs):
@@ -1886,7 +1652,7 @@ def test_files_matching(httpx_mock: HTTPXMock) -> None:
         response = client.put(
             "https://test_url", files={"name": ("file_name", b"File content")}
         )
-    assert response.content == b""
+    assert not response.content
 
 
 def test_files_and_data_matching(httpx_mock: HTTPXMock) -> None:
@@ -1901,111 +1667,77 @@ def test_files_and_data_matching(httpx_mock: HTTPXMock) -> None:
             files={"name": ("file_name", b"File content")},
             data={"field": "value"},
         )
-    assert response.content == b""
-
+    assert not response.content
 
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_files_not_matching_name(httpx_mock: HTTPXMock, monkeypatch) -> None:
-    # Ensure generated boundary will be fbe495efe4cd41b941ca13e254d6b018
-    monkeypatch.setattr(
-        os,
-        "urandom",
-        lambda length: b"\xfb\xe4\x95\xef\xe4\xcdA\xb9A\xca\x13\xe2T\xd6\xb0\x18",
-    )
 
+def test_files_matching_reusing_response(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
-        match_files={"name2": ("file_name", b"File content")}, is_optional=True
+        match_files={"name": ("file_name", b"File content")}, is_reusable=True
     )
 
     with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.put(
-                "https://test_url", files={"name1": ("file_name", b"File content")}
-            )
-        assert (
-            str(exception_info.value)
-            == """No response can be found for PUT request on https://test_url with b'--fbe495efe4cd41b941ca13e254d6b018\\r\\nContent-Disposition: form-data; name="name1"; filename="file_name"\\r\\nContent-Type: application/octet-stream\\r\\n\\r\\nFile content\\r\\n--fbe495efe4cd41b941ca13e254d6b018--\\r\\n' body amongst:
-- Match any request with {'name2': ('file_name', b'File content')} files"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_files_not_matching_file_name(httpx_mock: HTTPXMock, monkeypatch) -> None:
-    # Ensure generated boundary will be fbe495efe4cd41b941ca13e254d6b018
-    monkeypatch.setattr(
-        os,
-        "urandom",
-        lambda length: b"\xfb\xe4\x95\xef\xe4\xcdA\xb9A\xca\x13\xe2T\xd6\xb0\x18",
-    )
-
-    httpx_mock.add_response(
-        match_files={"name": ("file_name2", b"File content")}, is_optional=True
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.put(
-                "https://test_url", files={"name": ("file_name1", b"File content")}
-            )
-        assert (
-            str(exception_info.value)
-            == """No response can be found for PUT request on https://test_url with b'--fbe495efe4cd41b941ca13e254d6b018\\r\\nContent-Disposition: form-data; name="name"; filename="file_name1"\\r\\nContent-Type: application/octet-stream\\r\\n\\r\\nFile content\\r\\n--fbe495efe4cd41b941ca13e254d6b018--\\r\\n' body amongst:
-- Match any request with {'name': ('file_name2', b'File content')} files"""
-        )
-
-
-@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_files_not_matching_content(httpx_mock: HTTPXMock, monkeypatch) -> None:
-    # Ensure generated boundary will be fbe495efe4cd41b941ca13e254d6b018
-    monkeypatch.setattr(
-        os,
-        "urandom",
-        lambda length: b"\xfb\xe4\x95\xef\xe4\xcdA\xb9A\xca\x13\xe2T\xd6\xb0\x18",
-    )
-
-    httpx_mock.add_response(
-        match_files={"name": ("file_name", b"File content2")}, is_optional=True
-    )
-
-    with httpx.Client() as client:
-        with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.put(
-                "https://test_url", files={"name": ("file_name", b"File content1")}
+        # Each request is sent with a different multipart boundary
+        for _ in range(2):
+            response = client.put(
+                "https://test_url", files={"name": ("file_name", b"File content")}
             )
-        assert (
-            str(exception_info.value)
-            == """No response can be found for PUT request on https://test_url with b'--fbe495efe4cd41b941ca13e254d6b018\\r\\nContent-Disposition: form-data; name="name"; filename="file_name"\\r\\nContent-Type: application/octet-stream\\r\\n\\r\\nFile content1\\r\\n--fbe495efe4cd41b941ca13e254d6b018--\\r\\n' body amongst:
-- Match any request with {'name': ('file_name', b'File content2')} files"""
-        )
+            assert not response.content
 
 
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
-def test_files_matching_but_data_not_matching(
-    httpx_mock: HTTPXMock, monkeypatch
+@pytest.mark.parametrize(
+    ("match_files", "match_data", "files", "expected_message"),
+    [
+        pytest.param(
+            {"name2": ("file_name", b"File content")},
+            None,
+            {"name1": ("file_name", b"File content")},
+            """No response can be found for PUT request on https://test_url with b'--fbe495efe4cd41b941ca13e254d6b018\\r\\nContent-Disposition: form-data; name="name1"; filename="file_name"\\r\\nContent-Type: application/octet-stream\\r\\n\\r\\nFile content\\r\\n--fbe495efe4cd41b941ca13e254d6b018--\\r\\n' body amongst:
+- Match any request with {'name2': ('file_name', b'File content')} files""",
+            id="files_not_matching_name",
+        ),
+        pytest.param(
+            {"name": ("file_name2", b"File content")},
+            None,
+            {"name": ("file_name1", b"File content")},
+            """No response can be found for PUT request on https://test_url with b'--fbe495efe4cd41b941ca13e254d6b018\\r\\nContent-Disposition: form-data; name="name"; filename="file_name1"\\r\\nContent-Type: application/octet-stream\\r\\n\\r\\nFile content\\r\\n--fbe495efe4cd41b941ca13e254d6b018--\\r\\n' body amongst:
+- Match any request with {'name': ('file_name2', b'File content')} files""",
+            id="files_not_matching_file_name",
+        ),
+        pytest.param(
+            {"name": ("file_name", b"File content2")},
+            None,
+            {"name": ("file_name", b"File content1")},
+            """No response can be found for PUT request on https://test_url with b'--fbe495efe4cd41b941ca13e254d6b018\\r\\nContent-Disposition: form-data; name="name"; filename="file_name"\\r\\nContent-Type: application/octet-stream\\r\\n\\r\\nFile content1\\r\\n--fbe495efe4cd41b941ca13e254d6b018--\\r\\n' body amongst:
+- Match any request with {'name': ('file_name', b'File content2')} files""",
+            id="files_not_matching_content",
+        ),
+        pytest.param(
+            {"name": ("file_name", b"File content")},
+            {"field": "value"},
+            {"name": ("file_name", b"File content")},
+            """No response can be found for PUT request on https://test_url with b'--fbe495efe4cd41b941ca13e254d6b018\\r\\nContent-Disposition: form-data; name="name"; filename="file_name"\\r\\nContent-Type: application/octet-stream\\r\\n\\r\\nFile content\\r\\n--fbe495efe4cd41b941ca13e254d6b018--\\r\\n' body amongst:
+- Match any request with {'field': 'value'} multipart data and {'name': ('file_name', b'File content')} files""",
+            id="files_matching_but_data_not_matching",
+        ),
+    ],
+)
+def test_files_or_data_not_matching(
+    httpx_mock: HTTPXMock,
+    fixed_boundary,
+    match_files: Any,
+    match_data: Optional[dict[str, Any]],
+    files: Any,
+    expected_message: str,
 ) -> None:
-    # Ensure generated boundary will be fbe495efe4cd41b941ca13e254d6b018
-    monkeypatch.setattr(
-        os,
-        "urandom",
-        lambda length: b"\xfb\xe4\x95\xef\xe4\xcdA\xb9A\xca\x13\xe2T\xd6\xb0\x18",
-    )
-
     httpx_mock.add_response(
-        match_files={"name": ("file_name", b"File content")},
-        match_data={"field": "value"},
-        is_optional=True,
+        match_files=match_files, match_data=match_data, is_optional=True
     )
 
     with httpx.Client() as client:
         with pytest.raises(httpx.TimeoutException) as exception_info:
-            client.put(
-                "https://test_url", files={"name": ("file_name", b"File content")}
-            )
-        assert (
-            str(exception_info.value)
-            == """No response can be found for PUT request on https://test_url with b'--fbe495efe4cd41b941ca13e254d6b018\\r\\nContent-Disposition: form-data; name="name"; filename="file_name"\\r\\nContent-Type: application/octet-stream\\r\\n\\r\\nFile content\\r\\n--fbe495efe4cd41b941ca13e254d6b018--\\r\\n' body amongst:
-- Match any request with {'field': 'value'} multipart data and {'name': ('file_name', b'File content')} files"""
-        )
+            client.put("https://test_url", files=files)
+        assert str(exception_info.value) == expected_message
 
 
 def test_data_without_files(httpx_mock: HTTPXMock) -> None:
@@ -2019,19 +1751,17 @@ def test_data_without_files(httpx_mock: HTTPXMock) -> None:
 
 
 def test_timeout_matching(httpx_mock: HTTPXMock) -> None:
-    httpx_mock.add_response(
-        match_extensions={"timeout": {"connect": 5, "read": 5, "write": 10, "pool": 5}}
-    )
+    httpx_mock.add_response(match_extensions=WRITE_TIMEOUT_EXTENSIONS)
 
     with httpx.Client() as client:
         response = client.put("https://test_url", timeout=httpx.Timeout(5, write=10))
-    assert response.content == b""
+    assert not response.content
 
 
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
 def test_timeout_not_matching(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
-        match_extensions={"timeout": {"connect": 5, "read": 5, "write": 10, "pool": 5}},
+        match_extensions=WRITE_TIMEOUT_EXTENSIONS,
         is_optional=True,
     )
 
@@ -2052,7 +1782,7 @@ def test_extensions_matching(httpx_mock: HTTPXMock) -> None:
         response = client.put(
             "https://test_url", extensions={"test": "value", "test2": "value2"}
         )
-    assert response.content == b""
+    assert not response.content
 
 
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
@@ -2070,19 +1800,27 @@ def test_extensions_not_matching(httpx_mock: HTTPXMock) -> None:
 
 
 def test_optional_response_not_matched(httpx_mock: HTTPXMock) -> None:
-    # This response is optional and the fact that it was never requested should not trigger anything
-    httpx_mock.add_response(url="https://test_url", is_optional=True)
-    httpx_mock.add_response(url="https://test_url2")
+    httpx_mock.add_responses(
+        [
+            # This response is optional and the fact that it was never requested should not trigger anything
+            {"url": "https://test_url", "is_optional": True},
+            {"url": "https://test_url2"},
+        ]
+    )
 
     with httpx.Client() as client:
         response = client.get("https://test_url2")
-    assert response.content == b""
+    assert not response.content
 
 
 def test_optional_response_matched(httpx_mock: HTTPXMock) -> None:
-    # This response is optional and the fact that it was never requested should not trigger anything
-    httpx_mock.add_response(url="https://test_url", is_optional=True)
-    httpx_mock.add_response(url="https://test_url2")
+    httpx_mock.add_responses(
+        [
+            # This response is optional and the fact that it was never requested should not trigger anything
+            {"url": "https://test_url", "is_optional": True},
+            {"url": "https://test_url2"},
+        ]
+    )
 
     with httpx.Client() as client:
         response1 = client.get("https://test_url")
@@ -2093,14 +1831,18 @@ def test_optional_response_matched(httpx_mock: HTTPXMock) -> None:
 
 @pytest.mark.httpx_mock(assert_all_responses_were_requested=False)
 def test_mandatory_response_matched(httpx_mock: HTTPXMock) -> None:
-    # This response is optional and the fact that it was never requested should not trigger anything
-    httpx_mock.add_response(url="https://test_url")
-    # This response MUST be requested (overrides global settings via marker)
-    httpx_mock.add_response(url="https://test_url2", is_optional=False)
+    httpx_mock.add_responses(
+        [
+            # This response is optional and the fact that it was never requested should not trigger anything
+            {"url": "https://test_url"},
+            # This response MUST be requested (overrides global settings via marker)
+            {"url": "https://test_url2", "is_optional": False},
+        ]
+    )
 
     with httpx.Client() as client:
         response = client.get("https://test_url2")
-    assert response.content == b""
+    assert not response.content
 
 
 def test_multi_response_matched_once(httpx_mock: HTTPXMock) -> None:
@@ -2108,7 +1850,7 @@ def test_multi_response_matched_once(httpx_mock: HTTPXMock) -> None:
 
     with httpx.Client() as client:
         response = client.get("https://test_url")
-    assert response.content == b""
+    assert not response.content
 
 
 def test_multi_response_matched_twice(httpx_mock: HTTPXMock) -> None:
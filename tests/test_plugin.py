@@ -741,3 +741,33 @@ def test_reusable_response_not_matched(testdir: Testdir) -> None:
         ],
         consecutive=True,
     )
+
+
+def test_request_retrieval_with_more_than_one_async(testdir: Testdir) -> None:
+    """
+    Single request cannot be returned if there is more than one matching.
+    """
+    testdir.makepyfile(
+        """
+        import httpx
+        import pytest
+        
+        
+        @pytest.mark.asyncio
+        async def test_request_retrieval_with_more_than_one(httpx_mock):
+            httpx_mock.add_response(is_reusable=True)
+        
+            async with httpx.AsyncClient() as client:
+                await client.get("https://test_url", headers={"X-TEST": "test header 1"})
+                await client.get("https://test_url", headers={"X-TEST": "test header 2"})
+        
+            httpx_mock.get_request(url=httpx.URL("https://test_url"))
+    """
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*AssertionError: More than one request (2) matched, use get_requests instead or refine your filters."
+        ]
+    )